@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+
+@dataclass(slots=True)
+class Commit:
+    sha: str
+    subject: str
+    body: str
+
+
+def run_git(args: List[str]) -> str:
+    try:
+        out = subprocess.check_output(["git", *args], text=True).strip()
+    except subprocess.CalledProcessError as exc:
+        print(exc.output, file=sys.stderr)
+        raise
+    return out
+
+
+def is_zero_sha(value: str) -> bool:
+    return re.fullmatch(r"0+", value or "") is not None
+
+
+def _parse_record(record: bytes) -> Optional[Commit]:
+    record = record.strip()
+    if not record:
+        return None
+    parts = record.split(b"\x1f")
+    if len(parts) < 2:
+        return None
+    # Decode each field on its own; the sha is plain hex and an empty body
+    # needs no decoding at all.
+    sha = parts[0].decode("ascii")
+    subject = parts[1].decode("utf-8", "replace")
+    body = (
+        parts[2].decode("utf-8", "replace")
+        if len(parts) > 2 and parts[2]
+        else ""
+    )
+    return Commit(sha=sha, subject=subject, body=body)
+
+
+def iter_commits(
+    range_spec: Optional[str],
+    chunk_size: int = 65536,
+) -> Iterator[Commit]:
+    # Stream `git log` as raw bytes and yield commits as records complete
+    # instead of buffering and decoding the whole log first.
+    args = ["git", "log", "--format=%H%x1f%s%x1f%b%x1e"]
+    if range_spec:
+        args.insert(2, range_spec)
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE)
+    try:
+        buf = b""
+        while True:
+            chunk = proc.stdout.read(chunk_size)
+            if not chunk:
+                break
+            buf += chunk
+            *records, buf = buf.split(b"\x1e")
+            for record in records:
+                commit = _parse_record(record)
+                if commit is not None:
+                    yield commit
+        commit = _parse_record(buf)
+        if commit is not None:
+            yield commit
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, args)
+
+
+def is_merge_commit(commit: Commit) -> bool:
+    return commit.subject.startswith("Merge ")
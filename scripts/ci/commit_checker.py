@@ -3,58 +3,30 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import subprocess
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
-ALLOWED_TYPES = (
-    "feat",
-    "fix",
-    "chore",
-    "docs",
-    "refactor",
-    "perf",
-    "ci",
-    "build",
-    "style",
-    "revert",
-    "test",
-)
-
-MAX_SUBJECT_LEN = 84
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-CONVENTIONAL_RE = re.compile(
-    r"^(?P<type>" + "|".join(ALLOWED_TYPES) + r")"
-    r"(?P<scope>\([^)]+\))?"
-    r"(?P<breaking>!)?: "
-    r"(?P<subject>.+)$"
+from ctestfw._commit_re import MAX_SUBJECT_LEN, parse  # noqa: E402
+from _git_common import (  # noqa: E402
+    Commit,
+    is_merge_commit,
+    is_zero_sha,
+    iter_commits,
+    run_git,
 )
 
 
-@dataclass
-class Commit:
-    sha: str
-    subject: str
-    body: str
-
-
-@dataclass
+@dataclass(slots=True)
 class InvalidCommit:
     commit: Commit
     reason: str
 
 
-def run_git(args: List[str]) -> str:
-    try:
-        out = subprocess.check_output(["git", *args], text=True).strip()
-    except subprocess.CalledProcessError as exc:
-        print(exc.output, file=sys.stderr)
-        raise
-    return out
-
-
 def get_event_range() -> Optional[str]:
     override = os.environ.get("CHECK_RANGE")
     if override:
@@ -84,10 +56,6 @@ def get_event_range() -> Optional[str]:
     return None
 
 
-def is_zero_sha(value: str) -> bool:
-    return re.fullmatch(r"0+", value or "") is not None
-
-
 def range_for_ref(ref: str) -> str:
     try:
         run_git(["rev-parse", f"{ref}^"])
@@ -142,33 +110,6 @@ def compute_branch_range() -> str:
     return f"{base_sha}..HEAD"
 
 
-def iter_commits(range_spec: Optional[str]) -> Iterable[Commit]:
-    args = ["log", "--format=%H%x1f%s%x1f%b%x1e"]
-    if range_spec:
-        args.insert(1, range_spec)
-    raw = run_git(args)
-    if not raw:
-        return []
-    commits: List[Commit] = []
-    for record in raw.split("\x1e"):
-        record = record.strip()
-        if not record:
-            continue
-        parts = record.split("\x1f")
-        if len(parts) < 2:
-            continue
-        sha = parts[0]
-        subject = parts[1]
-        body = parts[2] if len(parts) > 2 else ""
-        commits.append(Commit(sha=sha, subject=subject, body=body))
-    return commits
-
-
-def is_merge_commit(commit: Commit) -> bool:
-    subject = commit.subject
-    return subject.startswith("Merge ") or subject.startswith("Merge pull request")
-
-
 def validate_commits(commits: Iterable[Commit]) -> List[InvalidCommit]:
     invalid: List[InvalidCommit] = []
     for commit in commits:
@@ -182,7 +123,7 @@ def validate_commits(commits: Iterable[Commit]) -> List[InvalidCommit]:
                 )
             )
             continue
-        if not CONVENTIONAL_RE.match(commit.subject):
+        if parse(commit.subject) is None:
             invalid.append(InvalidCommit(commit=commit, reason="invalid conventional format"))
     return invalid
 
@@ -192,7 +133,7 @@ def main() -> int:
     if not check_range:
         check_range = compute_branch_range()
     print(f"Commit check range: {check_range}")
-    commits = list(iter_commits(check_range))
+    commits = iter_commits(check_range)
     invalid = validate_commits(commits)
     if invalid:
         print("Non-conventional commits detected:", file=sys.stderr)
@@ -3,52 +3,14 @@ from __future__ import annotations
 
 import os
 import re
-import subprocess
 import sys
-from typing import Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
 
-ALLOWED_TYPES = (
-    "feat",
-    "fix",
-    "chore",
-    "docs",
-    "refactor",
-    "perf",
-    "ci",
-    "build",
-    "style",
-    "revert",
-    "test",
-)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-CONVENTIONAL_RE = re.compile(
-    r"^(?P<type>" + "|".join(ALLOWED_TYPES) + r")"
-    r"(?P<scope>\([^)]+\))?"
-    r"(?P<breaking>!)?: "
-    r"(?P<subject>.+)$"
-)
-
-BREAKING_RE = re.compile(r"^BREAKING[ -]CHANGE:", re.MULTILINE)
-
-
-class Commit:
-    def __init__(self, sha: str, subject: str, body: str) -> None:
-        self.sha = sha
-        self.subject = subject
-        self.body = body
-
-
-def run_git(args: List[str]) -> str:
-    try:
-        out = subprocess.check_output(["git", *args], text=True).strip()
-    except subprocess.CalledProcessError as exc:
-        print(exc.output, file=sys.stderr)
-        raise
-    return out
-
-
-def is_zero_sha(value: str) -> bool:
-    return re.fullmatch(r"0+", value or "") is not None
+from ctestfw._commit_re import BREAKING_RE, parse  # noqa: E402
+from _git_common import Commit, is_merge_commit, iter_commits, run_git  # noqa: E402
 
 
 def get_latest_tag() -> Optional[str]:
@@ -67,44 +29,21 @@ def parse_version(tag: Optional[str]) -> Tuple[int, int, int]:
     return tuple(int(p) for p in match.groups())
 
 
-def iter_commits(range_spec: Optional[str]) -> Iterable[Commit]:
-    args = ["log", "--format=%H%x1f%s%x1f%b%x1e"]
-    if range_spec:
-        args.insert(1, range_spec)
-    raw = run_git(args)
-    if not raw:
-        return []
-    commits: List[Commit] = []
-    for record in raw.split("\x1e"):
-        record = record.strip()
-        if not record:
-            continue
-        parts = record.split("\x1f")
-        if len(parts) < 2:
-            continue
-        sha = parts[0]
-        subject = parts[1]
-        body = parts[2] if len(parts) > 2 else ""
-        commits.append(Commit(sha=sha, subject=subject, body=body))
-    return commits
-
-
-def is_merge_commit(commit: Commit) -> bool:
-    subject = commit.subject
-    return subject.startswith("Merge ") or subject.startswith("Merge pull request")
-
-
 def classify_bump(commits: Iterable[Commit]) -> str:
     bump = "none"
     for commit in commits:
         if is_merge_commit(commit):
             continue
-        match = CONVENTIONAL_RE.match(commit.subject)
-        if not match:
+        parsed = parse(commit.subject)
+        if parsed is None:
             continue
-        if match.group("breaking") or BREAKING_RE.search(commit.body or ""):
+        ctype, _scope, breaking, _desc = parsed
+        if breaking:
+            return "major"
+        body = commit.body
+        # Cheap substring test first: most bodies never mention BREAKING.
+        if body and "BREAKING" in body and BREAKING_RE.search(body):
             return "major"
-        ctype = match.group("type")
         if ctype == "feat" and bump != "minor":
             bump = "minor"
         elif ctype == "fix" and bump == "none":
@@ -138,7 +77,7 @@ def main() -> int:
     if not version_range:
         version_range = f"{base_tag}..HEAD" if base_tag else "HEAD"
 
-    version_commits = list(iter_commits(version_range))
+    version_commits = iter_commits(version_range)
     bump = classify_bump(version_commits)
     next_version = bump_version(base_version, bump)
 
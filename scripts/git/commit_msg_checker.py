@@ -1,31 +1,16 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import re
 import sys
+from pathlib import Path
 from typing import List
 
-ALLOWED_TYPES = (
-    "feat",
-    "fix",
-    "chore",
-    "docs",
-    "refactor",
-    "perf",
-    "ci",
-    "build",
-    "style",
-    "revert",
-    "test",
-)
-
-MAX_SUBJECT_LEN = 84
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-CONVENTIONAL_RE = re.compile(
-    r"^(?P<type>" + "|".join(ALLOWED_TYPES) + r")"
-    r"(?P<scope>\([^)]+\))?"
-    r"(?P<breaking>!)?: "
-    r"(?P<subject>.+)$"
+from ctestfw._commit_re import (  # noqa: E402
+    ALLOWED_TYPES,
+    MAX_SUBJECT_LEN,
+    parse,
 )
 
 
@@ -42,7 +27,7 @@ def read_subject(path: str) -> str:
 
 
 def is_merge_message(subject: str) -> bool:
-    return subject.startswith("Merge ") or subject.startswith("Merge pull request")
+    return subject.startswith("Merge ")
 
 
 def is_git_revert(subject: str) -> bool:
@@ -69,7 +54,7 @@ def main(argv: List[str]) -> int:
         )
         return 1
 
-    if not CONVENTIONAL_RE.match(subject):
+    if parse(subject) is None:
         print("Commit message must follow Conventional Commits.", file=sys.stderr)
         print(f"Got: {subject}", file=sys.stderr)
         print(
@@ -0,0 +1,54 @@
+from __future__ import annotations
+import re
+from typing import Optional, Tuple
+
+ALLOWED_TYPES = (
+    "feat",
+    "fix",
+    "chore",
+    "docs",
+    "refactor",
+    "perf",
+    "ci",
+    "build",
+    "style",
+    "revert",
+    "test",
+)
+
+MAX_SUBJECT_LEN = 84
+
+_TYPES = frozenset(ALLOWED_TYPES)
+
+# Everything after the type: optional scope, optional "!", then ": subject".
+_TAIL = re.compile(
+    r"(?P<scope>\([^)]+\))?"
+    r"(?P<breaking>!)?: "
+    r"(?P<subject>.+)$"
+)
+
+BREAKING_RE = re.compile(r"^BREAKING[ -]CHANGE:", re.MULTILINE)
+
+
+def parse(
+    subject: str,
+) -> Optional[Tuple[str, Optional[str], bool, str]]:
+    # (type, scope, breaking, description) or None if not conventional.
+    # The type is split off at the first "(", "!" or ":" and checked with a
+    # set lookup instead of a regex alternation over ALLOWED_TYPES.
+    end = len(subject)
+    for delim in "(!:":
+        i = subject.find(delim, 0, end)
+        if i != -1:
+            end = i
+    if subject[:end] not in _TYPES:
+        return None
+    match = _TAIL.match(subject, end)
+    if not match:
+        return None
+    return (
+        subject[:end],
+        match.group("scope"),
+        match.group("breaking") is not None,
+        match.group("subject"),
+    )
@@ -1,29 +1,56 @@
 from __future__ import annotations
+import os
 from pathlib import Path
-from typing import Sequence, Union
+from typing import Optional, Sequence, Union
 
 from .core import Assertion, require
 from ..result import CompileResult
 from ..platform import OS
-from ..inspect.filetype import detect_artifact_kind, ArtifactKind
+from ..inspect.filetype import (
+    detect_artifact_kind,
+    ArtifactKind,
+    _detect_from_bytes,
+)
 
 
-def assert_exit_code(expected: int = 0) -> Assertion:
-    def _check(res: CompileResult) -> None:
+# Each assertion kind is a small callable class holding its parameters in
+# __slots__, so building many assertions creates instances of a few shared
+# classes instead of one closure per assertion.
+
+
+class _ExitCodeCheck:
+    __slots__ = ("expected",)
+
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+
+    def __call__(self, res: CompileResult) -> None:
         require(
-            res.run.exit_code == expected,
+            res.run.exit_code == self.expected,
             (
-                f"exit_code expected {expected}, got {res.run.exit_code}\n"
+                f"exit_code expected {self.expected}, "
+                f"got {res.run.exit_code}\n"
                 f"stderr:\n{res.run.stderr}"
             ),
         )
-    return Assertion(name=f"exit_code_is_{expected}", check=_check)
 
 
-def assert_argv_contains(subseq: Sequence[str]) -> Assertion:
-    def _check(res: CompileResult) -> None:
+def assert_exit_code(expected: int = 0) -> Assertion:
+    return Assertion(
+        name=f"exit_code_is_{expected}",
+        check=_ExitCodeCheck(expected),
+    )
+
+
+class _ArgvContainsCheck:
+    __slots__ = ("subseq",)
+
+    def __init__(self, subseq: Sequence[str]) -> None:
+        self.subseq = list(map(str, subseq))
+
+    def __call__(self, res: CompileResult) -> None:
         argv = list(res.run.argv)
-        ssub = list(map(str, subseq))
+        ssub = self.subseq
         # simple containment check (order independent or dependent?
         # -> here: dependent-ish)
         it = iter(argv)
@@ -36,151 +63,307 @@ def assert_argv_contains(subseq: Sequence[str]) -> Assertion:
                 ok = False
                 break
         require(ok, f"argv does not contain subsequence {ssub}\nargv={argv}")
-    return Assertion(name="argv_contains", check=_check)
 
 
-def assert_output_name(expected_name: str) -> Assertion:
-    def _check(res: CompileResult) -> None:
+def assert_argv_contains(subseq: Sequence[str]) -> Assertion:
+    return Assertion(name="argv_contains", check=_ArgvContainsCheck(subseq))
+
+
+class _OutputNameCheck:
+    __slots__ = ("expected_name",)
+
+    def __init__(self, expected_name: str) -> None:
+        self.expected_name = expected_name
+
+    def __call__(self, res: CompileResult) -> None:
         require(res.output_path is not None, "no output_path provided to test")
         require(
-            res.output_path.name == expected_name,
+            res.output_path.name == self.expected_name,
             (
-                f"output name expected '{expected_name}', got "
+                f"output name expected '{self.expected_name}', got "
                 f"'{res.output_path.name}'"
             ),
         )
-    return Assertion(name="output_name", check=_check)
 
 
-def assert_output_exists() -> Assertion:
-    def _check(res: CompileResult) -> None:
+def assert_output_name(expected_name: str) -> Assertion:
+    return Assertion(
+        name="output_name",
+        check=_OutputNameCheck(expected_name),
+    )
+
+
+class _OutputExistsCheck:
+    __slots__ = ()
+
+    def __call__(self, res: CompileResult) -> None:
         require(res.output_path is not None, "no output_path provided to test")
         require(
-            res.output_path.exists(),
+            os.path.exists(res.output_path),
             f"output does not exist: {res.output_path}",
         )
-    return Assertion(name="output_exists", check=_check)
 
 
-def assert_output_kind(expected: ArtifactKind) -> Assertion:
-    def _check(res: CompileResult) -> None:
+def assert_output_exists() -> Assertion:
+    return Assertion(name="output_exists", check=_OutputExistsCheck())
+
+
+class _OutputKindCheck:
+    __slots__ = ("expected",)
+
+    def __init__(self, expected: ArtifactKind) -> None:
+        self.expected = expected
+
+    def __call__(self, res: CompileResult) -> None:
         require(res.output_path is not None, "no output_path provided to test")
         require(
-            res.output_path.exists(),
+            os.path.exists(res.output_path),
             f"output does not exist: {res.output_path}",
         )
         info = detect_artifact_kind(res.output_path)
         require(
-            info.kind == expected,
+            info.kind == self.expected,
             (
-                f"output kind expected {expected.name}, got {info.kind.name} "
-                f"({info.path})"
+                f"output kind expected {self.expected.name}, "
+                f"got {info.kind.name} ({info.path})"
             ),
         )
-    return Assertion(name=f"output_kind_{expected.name}", check=_check)
 
 
-def _resolve_output_path(res: CompileResult, path: Union[str, Path]) -> Path:
-    p = Path(path)
-    if not p.is_absolute():
-        p = res.run.cwd / p
-    return p
+def assert_output_kind(expected: ArtifactKind) -> Assertion:
+    return Assertion(
+        name=f"output_kind_{expected.name}",
+        check=_OutputKindCheck(expected),
+    )
+
+
+def _stat(p: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(p)
+    except OSError:
+        return None
+
+
+def _resolve_output_path(res: CompileResult, path: Union[str, Path]) -> str:
+    # Plain string join: the result only feeds os.* calls and messages.
+    s = os.fspath(path)
+    if os.path.isabs(s):
+        return s
+    return os.path.join(os.fspath(res.run.cwd), s)
+
+
+class _OutputExistsAtCheck:
+    __slots__ = ("path",)
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+
+    def __call__(self, res: CompileResult) -> None:
+        p = _resolve_output_path(res, self.path)
+        require(os.path.exists(p), f"output does not exist: {p}")
 
 
 def assert_output_exists_at(path: Union[str, Path]) -> Assertion:
-    def _check(res: CompileResult) -> None:
-        p = _resolve_output_path(res, path)
-        require(p.exists(), f"output does not exist: {p}")
-    return Assertion(name=f"output_exists_at_{Path(path).name}", check=_check)
+    return Assertion(
+        name=f"output_exists_at_{Path(path).name}",
+        check=_OutputExistsAtCheck(path),
+    )
 
 
-def assert_output_kind_at(
-    path: Union[str, Path],
-    expected: ArtifactKind,
-) -> Assertion:
-    def _check(res: CompileResult) -> None:
-        p = _resolve_output_path(res, path)
-        require(p.exists(), f"output does not exist: {p}")
-        info = detect_artifact_kind(p)
+class _OutputKindAtCheck:
+    __slots__ = ("path", "expected")
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        expected: ArtifactKind,
+    ) -> None:
+        self.path = path
+        self.expected = expected
+
+    def __call__(self, res: CompileResult) -> None:
+        p = _resolve_output_path(res, self.path)
+        require(os.path.exists(p), f"output does not exist: {p}")
+        info = detect_artifact_kind(Path(p))
         require(
-            info.kind == expected,
+            info.kind == self.expected,
             (
-                f"output kind expected {expected.name}, got {info.kind.name} "
-                f"({info.path})"
+                f"output kind expected {self.expected.name}, "
+                f"got {info.kind.name} ({info.path})"
             ),
         )
-    return Assertion(name=f"output_kind_at_{expected.name}", check=_check)
+
+
+def assert_output_kind_at(
+    path: Union[str, Path],
+    expected: ArtifactKind,
+) -> Assertion:
+    return Assertion(
+        name=f"output_kind_at_{expected.name}",
+        check=_OutputKindAtCheck(path, expected),
+    )
+
+
+class _OutputNonemptyAtCheck:
+    __slots__ = ("path",)
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+
+    def __call__(self, res: CompileResult) -> None:
+        p = _resolve_output_path(res, self.path)
+        st = _stat(p)
+        require(st is not None, f"output does not exist: {p}")
+        require(st.st_size > 0, f"output is empty: {p}")
 
 
 def assert_output_nonempty_at(path: Union[str, Path]) -> Assertion:
-    def _check(res: CompileResult) -> None:
-        p = _resolve_output_path(res, path)
-        require(p.exists(), f"output does not exist: {p}")
-        require(p.stat().st_size > 0, f"output is empty: {p}")
-    name = f"output_nonempty_at_{Path(path).name}"
-    return Assertion(name=name, check=_check)
+    return Assertion(
+        name=f"output_nonempty_at_{Path(path).name}",
+        check=_OutputNonemptyAtCheck(path),
+    )
 
 
-def assert_stdout_contains(text: str) -> Assertion:
-    def _check(res: CompileResult) -> None:
+class _OutputAtCheck:
+    __slots__ = ("path", "kind", "nonempty")
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        kind: Optional[ArtifactKind],
+        nonempty: bool,
+    ) -> None:
+        self.path = path
+        self.kind = kind
+        self.nonempty = nonempty
+
+    def __call__(self, res: CompileResult) -> None:
+        p = _resolve_output_path(res, self.path)
+        try:
+            fd = os.open(p, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                data = os.read(fd, 64) if self.kind is not None else b""
+            finally:
+                os.close(fd)
+        except FileNotFoundError:
+            require(False, f"output does not exist: {p}")
+        except OSError as exc:
+            # e.g. permission denied, or a directory when a kind is wanted
+            require(False, f"cannot read output: {p}: {exc}")
+        if self.nonempty:
+            require(st.st_size > 0, f"output is empty: {p}")
+        if self.kind is not None:
+            got = _detect_from_bytes(data)
+            require(
+                got == self.kind,
+                (
+                    f"output kind expected {self.kind.name}, "
+                    f"got {got.name} ({p})"
+                ),
+            )
+
+
+def assert_output_at(
+    path: Union[str, Path],
+    *,
+    kind: Optional[ArtifactKind] = None,
+    nonempty: bool = False,
+) -> Assertion:
+    # Fused exists/nonempty/kind check: one open + fstat (+ one 64-byte read
+    # when a kind is requested) instead of a stat or read per assertion.
+    return Assertion(
+        name=f"output_at_{Path(path).name}",
+        check=_OutputAtCheck(path, kind, nonempty),
+    )
+
+
+class _StdoutContainsCheck:
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def __call__(self, res: CompileResult) -> None:
         require(
-            text in (res.run.stdout or ""),
+            self.text in (res.run.stdout or ""),
             (
-                f"stdout does not contain '{text}'\nstdout:\n{res.run.stdout}"
+                f"stdout does not contain '{self.text}'\n"
+                f"stdout:\n{res.run.stdout}"
                 f"\nstderr:\n{res.run.stderr}"
             ),
         )
-    return Assertion(name=f"stdout_contains_{text}", check=_check)
 
 
-def assert_native_binary_kind() -> Assertion:
-    def _check(res: CompileResult) -> None:
+def assert_stdout_contains(text: str) -> Assertion:
+    return Assertion(
+        name=f"stdout_contains_{text}",
+        check=_StdoutContainsCheck(text),
+    )
+
+
+def _native_kind(res: CompileResult) -> ArtifactKind:
+    require(
+        res.platform is not None,
+        "platform info missing in CompileResult",
+    )
+    return (
+        ArtifactKind.MACHO
+        if res.platform.os == OS.MACOS
+        else ArtifactKind.ELF
+    )
+
+
+def _require_native_kind(
+    res: CompileResult,
+    expected: ArtifactKind,
+    p: Path,
+) -> None:
+    info = detect_artifact_kind(p)
+    require(
+        info.kind == expected,
+        (
+            f"native output kind expected {expected.name} on "
+            f"{res.platform.os.name}, got {info.kind.name} ({info.path})"
+        ),
+    )
+
+
+class _NativeBinaryKindCheck:
+    __slots__ = ()
+
+    def __call__(self, res: CompileResult) -> None:
         require(res.output_path is not None, "no output_path provided to test")
+        expected = _native_kind(res)
         require(
-            res.platform is not None,
-            "platform info missing in CompileResult",
-        )
-        require(
-            res.output_path.exists(),
+            os.path.exists(res.output_path),
             f"output does not exist: {res.output_path}",
         )
+        _require_native_kind(res, expected, res.output_path)
 
-        expected = (
-            ArtifactKind.MACHO
-            if res.platform.os == OS.MACOS
-            else ArtifactKind.ELF
-        )
-        info = detect_artifact_kind(res.output_path)
 
-        require(
-            info.kind == expected,
-            (
-                f"native output kind expected {expected.name} on "
-                f"{res.platform.os.name}, got {info.kind.name} ({info.path})"
-            ),
-        )
-    return Assertion(name="native_binary_kind", check=_check)
+def assert_native_binary_kind() -> Assertion:
+    return Assertion(
+        name="native_binary_kind",
+        check=_NativeBinaryKindCheck(),
+    )
+
+
+class _NativeBinaryKindAtCheck:
+    __slots__ = ("path",)
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+
+    def __call__(self, res: CompileResult) -> None:
+        expected = _native_kind(res)
+        p = _resolve_output_path(res, self.path)
+        require(os.path.exists(p), f"output does not exist: {p}")
+        _require_native_kind(res, expected, Path(p))
 
 
 def assert_native_binary_kind_at(path: Union[str, Path]) -> Assertion:
-    def _check(res: CompileResult) -> None:
-        require(
-            res.platform is not None,
-            "platform info missing in CompileResult",
-        )
-        p = _resolve_output_path(res, path)
-        require(p.exists(), f"output does not exist: {p}")
-        expected = (
-            ArtifactKind.MACHO
-            if res.platform.os == OS.MACOS
-            else ArtifactKind.ELF
-        )
-        info = detect_artifact_kind(p)
-        require(
-            info.kind == expected,
-            (
-                f"native output kind expected {expected.name} on "
-                f"{res.platform.os.name}, got {info.kind.name} ({info.path})"
-            ),
-        )
-    return Assertion(name="native_binary_kind_at", check=_check)
+    return Assertion(
+        name="native_binary_kind_at",
+        check=_NativeBinaryKindAtCheck(path),
+    )
@@ -1,21 +1,25 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import sys
 from .suite import SuiteReport
 
 
 @dataclass(frozen=True)
 class ConsoleReporter:
     def render(self, rep: SuiteReport) -> int:
-        print(f"== Suite: {rep.name} ==")
+        # Build the whole report and write it once rather than print()ing
+        # line by line.
+        lines = [f"== Suite: {rep.name} =="]
         total = len(rep.reports)
         failed = 0
         for r in rep.reports:
             status = "PASS" if r.ok else "FAIL"
-            print(f"- {status} {r.name}")
+            lines.append(f"- {status} {r.name}")
             if not r.ok:
                 failed += 1
                 for e in r.errors:
-                    print(f"    {e}")
+                    lines.append(f"    {e}")
         passed = total - failed
-        print(f"== Result: {passed}/{total} passed ==")
+        lines.append(f"== Result: {passed}/{total} passed ==")
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0 if failed == 0 else 1
@@ -1,7 +1,9 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+import os
 from pathlib import Path
-import tempfile
+import shutil
 from typing import List
 
 from .testcase import TestCase, TestReport
@@ -17,21 +19,61 @@ class TestSuite:
         self,
         runner: CompilerRunner,
         root_workspace: Path,
+        parallel: bool = True,
     ) -> "SuiteReport":
-        root_workspace.mkdir(parents=True, exist_ok=True)
-        reports: List[TestReport] = []
-        for tc in self.cases:
-            with tempfile.TemporaryDirectory(
-                prefix=f"{tc.name}_",
-                dir=str(root_workspace),
-            ) as d:
-                ws = Path(d)
-                # Caller copies sources into ws if needed (see example)
-                reports.append(tc.run(runner, ws))
+        # Absolute, since each workspace is used both as the subprocess cwd
+        # and as the prefix of the "-o" path.
+        root_workspace = root_workspace.resolve()
+        # One directory per suite so suites sharing a root_workspace never
+        # reuse (and wipe) each other's case workspaces.
+        suite_workspace = root_workspace / self.name
+        suite_workspace.mkdir(parents=True, exist_ok=True)
+        keep = os.environ.get("CTESTFW_KEEP_WORKSPACE") == "1"
+        reports: List[TestReport]
+        if parallel and len(self.cases) > 1:
+            # Cases spend their time waiting on the compiler subprocess, so
+            # threads are enough; reports keep the order of self.cases.
+            workers = min(len(self.cases), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [
+                    ex.submit(_run_one, tc, i, runner, suite_workspace, keep)
+                    for i, tc in enumerate(self.cases)
+                ]
+                reports = [f.result() for f in futures]
+        else:
+            reports = [
+                _run_one(tc, i, runner, suite_workspace, keep)
+                for i, tc in enumerate(self.cases)
+            ]
         return SuiteReport(self.name, reports)
 
 
-@dataclass(frozen=True)
+def _run_one(
+    tc: TestCase,
+    index: int,
+    runner: CompilerRunner,
+    suite_workspace: Path,
+    keep: bool,
+) -> TestReport:
+    # Deterministic per-test workspace: the index keeps names unique even
+    # when several cases share a name. Set CTESTFW_KEEP_WORKSPACE=1 to
+    # leave it on disk for inspection.
+    ws = suite_workspace / f"{tc.name}_{index}"
+    try:
+        ws.mkdir()
+    except FileExistsError:
+        # Left over from a previous run of this suite.
+        shutil.rmtree(ws)
+        ws.mkdir()
+    try:
+        # Caller copies sources into ws if needed (see example)
+        return tc.run(runner, ws)
+    finally:
+        if not keep:
+            shutil.rmtree(ws, ignore_errors=True)
+
+
+@dataclass(frozen=True, slots=True)
 class SuiteReport:
     name: str
     reports: List[TestReport]
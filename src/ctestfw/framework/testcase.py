@@ -21,30 +21,32 @@ class TestCase:
         workspace: Path,
     ) -> "TestReport":
         # workspace is per-test temp dir
-        out_path = (
-            workspace / self.plan.out
-            if self.plan.out
-            else None
-        )
-        argv = self.plan.argv()
         if self.plan.out:
-            # ensure "-o workspace/out" rather than relative confusion
-            # Here we patch argv: replace the -o argument with the workspace
-            # path.
-            # Simple strategy: rebuild properly.
-            argv = []
-            sources: List[str] = []
-            for s in self.plan.sources:
-                s_str = str(s)
-                if s_str.startswith("/"):
-                    sources.append(s_str)
-                else:
-                    sources.append(str(workspace / s))
-            argv.extend(sources)
+            # Build argv directly with "-o workspace/out" (and relative
+            # sources resolved against the workspace) instead of patching
+            # the output of plan.argv().
+            out_path = workspace / self.plan.out
+            argv = [
+                str(s) if s.is_absolute() else str(workspace / s)
+                for s in map(Path, self.plan.sources)
+            ]
             argv.extend(["-o", str(out_path)])
-            argv.extend(list(self.plan.extra_args))
+            argv.extend(self.plan.extra_args)
+        else:
+            out_path = None
+            argv = self.plan.argv()
 
-        res = runner.compile(args=argv, cwd=workspace, output_path=out_path)
+        # Assertions on the output streams need them captured, even when
+        # the runner is configured with capture="none".
+        needs_streams = any(
+            a.name.startswith(("stdout_", "stderr_")) for a in self.assertions
+        )
+        res = runner.compile(
+            args=argv,
+            cwd=workspace,
+            output_path=out_path,
+            needs_streams=needs_streams,
+        )
 
         errors: List[str] = []
         for a in self.assertions:
@@ -61,7 +63,7 @@ class TestCase:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TestReport:
     name: str
     ok: bool
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
+import functools
+import os
 from pathlib import Path
 
 
@@ -12,39 +14,42 @@ class ArtifactKind(Enum):
     UNKNOWN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArtifactInfo:
     path: Path
     kind: ArtifactKind
 
 
-def _read_prefix(p: Path, n: int = 64) -> bytes:
-    with p.open("rb") as f:
-        return f.read(n)
+# First four bytes of each binary format we recognise.
+_MAGIC = {
+    # ELF: 0x7F 'E' 'L' 'F'
+    b"\x7fELF": ArtifactKind.ELF,
+    # Mach-O, both byte orders:
+    # 0xFEEDFACE, 0xFEEDFACF (64-bit), 0xCAFEBABE (fat)
+    b"\xfe\xed\xfa\xce": ArtifactKind.MACHO,
+    b"\xce\xfa\xed\xfe": ArtifactKind.MACHO,
+    b"\xfe\xed\xfa\xcf": ArtifactKind.MACHO,
+    b"\xcf\xfa\xed\xfe": ArtifactKind.MACHO,
+    b"\xca\xfe\xba\xbe": ArtifactKind.MACHO,
+    b"\xbe\xba\xfe\xca": ArtifactKind.MACHO,
+    # LLVM bitcode: 'B' 'C' 0xC0 0xDE
+    b"BC\xc0\xde": ArtifactKind.LLVM_BITCODE,
+}
 
 
-def detect_artifact_kind(p: Path) -> ArtifactInfo:
-    data = _read_prefix(p, 64)
+def _read_prefix(p: Path, n: int = 64) -> bytes:
+    # Raw fd read: no buffered file object is needed for a few bytes.
+    fd = os.open(p, os.O_RDONLY)
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
 
-    # ELF: 0x7F 'E' 'L' 'F'
-    if len(data) >= 4 and data[0:4] == b"\x7fELF":
-        return ArtifactInfo(p, ArtifactKind.ELF)
-
-    # Mach-O (several magics):
-    # 0xFEEDFACE, 0xCEFAEDFE, 0xFEEDFACF, 0xCFFAEDFE, 0xCAFEBABE (fat)
-    if len(data) >= 4:
-        magic = int.from_bytes(data[0:4], byteorder="big", signed=False)
-        magic_le = int.from_bytes(data[0:4], byteorder="little", signed=False)
-        macho_magics = {
-            0xFEEDFACE, 0xFEEDFACF, 0xCAFEBABE,
-            0xCEFAEDFE, 0xCFFAEDFE, 0xBEBAFECA,  # includes swapped/fat
-        }
-        if magic in macho_magics or magic_le in macho_magics:
-            return ArtifactInfo(p, ArtifactKind.MACHO)
-
-    # LLVM bitcode often starts with 'BC' 0xC0 0xDE
-    if len(data) >= 4 and data[0:4] == b"BC\xc0\xde":
-        return ArtifactInfo(p, ArtifactKind.LLVM_BITCODE)
+
+def _detect_from_bytes(data: bytes) -> ArtifactKind:
+    kind = _MAGIC.get(data[:4])
+    if kind is not None:
+        return kind
 
     # LLVM IR text is plain text; common first tokens:
     # ; ModuleID = ...
@@ -59,8 +64,21 @@ def detect_artifact_kind(p: Path) -> ArtifactInfo:
             or "target triple" in head[:120]
         )
         if is_ir_text:
-            return ArtifactInfo(p, ArtifactKind.LLVM_IR_TEXT)
+            return ArtifactKind.LLVM_IR_TEXT
     except Exception:
         pass
 
-    return ArtifactInfo(p, ArtifactKind.UNKNOWN)
+    return ArtifactKind.UNKNOWN
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_cached(path: str, mtime_ns: int, size: int) -> ArtifactKind:
+    # mtime_ns/size are only part of the cache key: a rewritten artifact
+    # misses the cache and gets sniffed again.
+    return _detect_from_bytes(_read_prefix(Path(path), 64))
+
+
+def detect_artifact_kind(p: Path) -> ArtifactInfo:
+    st = os.stat(p)
+    kind = _detect_cached(os.fspath(p), st.st_mtime_ns, st.st_size)
+    return ArtifactInfo(p, kind)
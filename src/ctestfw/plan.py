@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import List, Optional, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompilePlan:
     name: str
     sources: Sequence[Path]
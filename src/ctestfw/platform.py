@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
+import functools
 import platform
 
 
@@ -19,7 +20,7 @@ class Arch(Enum):
     OTHER = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlatformInfo:
     os: OS
     arch: Arch
@@ -27,7 +28,9 @@ class PlatformInfo:
     system: str
 
 
+@functools.lru_cache(maxsize=1)
 def detect_platform() -> PlatformInfo:
+    # The host does not change during a run; compute it once per process.
     system = platform.system().lower()
     machine = platform.machine().lower()
 
@@ -6,7 +6,7 @@ from typing import Optional, Sequence, Dict
 from .platform import PlatformInfo
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     argv: Sequence[str]
     cwd: Path
@@ -19,7 +19,7 @@ class RunResult:
         return self.exit_code == 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompileResult:
     run: RunResult
     output_path: Optional[Path] = None  # main artifact, if any
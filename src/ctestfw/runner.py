@@ -2,17 +2,32 @@ from __future__ import annotations
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, Literal, Optional, Sequence
 
 from .result import RunResult, CompileResult
 from .platform import detect_platform
 
+# How stdout/stderr of the tool are collected:
+# - "text": decoded by subprocess (locale encoding, universal newlines)
+# - "bytes": captured raw, decoded as UTF-8 only when non-empty
+# - "none": stdout is discarded (RunResult.stdout is ""); stderr is still
+#   captured like "bytes" so failure messages keep the diagnostics
+# With needs_streams=True (set by TestCase.run for stdout_*/stderr_*
+# assertions) "none" is upgraded to "bytes"; "text"/"bytes" are kept as
+# configured. Custom assertions that read stdout need a capturing runner.
+CaptureMode = Literal["text", "bytes", "none"]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RunnerConfig:
     executable: Path
     default_timeout_s: float = 20.0
     default_env: Optional[Dict[str, str]] = None
+    capture: CaptureMode = "text"
+
+
+def _decode(data: Optional[bytes]) -> str:
+    return data.decode("utf-8", errors="replace") if data else ""
 
 
 class CompilerRunner:
@@ -25,26 +40,42 @@ class CompilerRunner:
         cwd: Path,
         env: Optional[Dict[str, str]] = None,
         timeout_s: Optional[float] = None,
+        capture: Optional[CaptureMode] = None,
+        needs_streams: bool = False,
     ) -> RunResult:
         argv = [str(self._cfg.executable), *map(str, args)]
         merged_env = dict(self._cfg.default_env or {})
         if env:
             merged_env.update(env)
+        capture = capture or self._cfg.capture
+        if needs_streams and capture == "none":
+            capture = "bytes"
 
+        if capture == "none":
+            stdout_stream = subprocess.DEVNULL
+        else:
+            stdout_stream = subprocess.PIPE
         p = subprocess.run(
             argv,
             cwd=str(cwd),
             env=merged_env if merged_env else None,
-            capture_output=True,
-            text=True,
+            stdout=stdout_stream,
+            stderr=subprocess.PIPE,
+            text=(capture == "text"),
             timeout=timeout_s or self._cfg.default_timeout_s,
         )
+        if capture == "text":
+            stdout = p.stdout or ""
+            stderr = p.stderr or ""
+        else:
+            stdout = _decode(p.stdout)
+            stderr = _decode(p.stderr)
         return RunResult(
             argv=argv,
             cwd=cwd,
             exit_code=p.returncode,
-            stdout=p.stdout or "",
-            stderr=p.stderr or "",
+            stdout=stdout,
+            stderr=stderr,
             env=merged_env if merged_env else None,
         )
 
@@ -55,8 +86,17 @@ class CompilerRunner:
         output_path: Optional[Path] = None,
         env: Optional[Dict[str, str]] = None,
         timeout_s: Optional[float] = None,
+        capture: Optional[CaptureMode] = None,
+        needs_streams: bool = False,
     ) -> CompileResult:
-        rr = self.run(args=args, cwd=cwd, env=env, timeout_s=timeout_s)
+        rr = self.run(
+            args=args,
+            cwd=cwd,
+            env=env,
+            timeout_s=timeout_s,
+            capture=capture,
+            needs_streams=needs_streams,
+        )
         return CompileResult(
             run=rr,
             output_path=output_path,